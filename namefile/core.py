@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import datetime
 import re
+import string
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Iterable, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, TypeVar
 
-from packaging.version import LegacyVersion, Version
-from packaging.version import parse as version_parse
+if TYPE_CHECKING:
+    from packaging.version import Version
 
 T = TypeVar('T')
 DATE_FORMAT = '%Y%m%d'
@@ -18,8 +21,87 @@ VERSION_PATTERN = r'(\.(?P<version>[\w\.]+))?'
 VALID_SUFFIX_PATTERN = r'\w*[a-zA-Z]'
 SUFFIX_PATTERN = rf'\.(?P<suffix>{VALID_SUFFIX_PATTERN})$'
 INVALID_STEM_CHAR = set('.- /')
+# kept for compatibility, :meth:`FileInfo.parse` uses :func:`_scan_name`, which accepts names these match in full
 FILE_NAME_PATTERN = re.compile(STEM_PATTERN + TAG_PATTERN + DATE_PATTERN + VERSION_PATTERN + SUFFIX_PATTERN)
 DIR_NAME_PATTERN = re.compile(STEM_PATTERN + TAG_PATTERN + DATE_PATTERN + VERSION_PATTERN)
+_STEM_TRANS = str.maketrans({char: '_' for char in INVALID_STEM_CHAR})
+# ``slots`` is only supported by ``dataclass`` since python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _is_word(text: str) -> bool:
+    # same as ``re.fullmatch(r'\w+', text)``, ``\w`` is ``str.isalnum`` or ``_``
+    return text.replace('_', 'a').isalnum()
+
+
+def _is_suffix(text: str) -> bool:
+    return _is_word(text) and text[-1] in string.ascii_letters
+
+
+def _scan_version_suffix(parts: list[str]) -> None | tuple[None | str, None | str]:
+    if not parts:
+        return None, None
+    suffix = parts[-1]
+    if _is_suffix(suffix):
+        if len(parts) == 1:
+            return None, suffix
+        version = '.'.join(parts[:-1])
+        if _is_word(version.replace('.', '_')):
+            return version, suffix
+    version = '.'.join(parts)
+    if _is_word(version.replace('.', '_')):
+        return version, None
+
+
+def _scan_name(file_name: str) -> None | tuple[str, None | str, None | str, None | str, None | str]:
+    """Split file name into stem, tags, date, version and suffix, return ``None`` if it is invalid.
+
+    file name is ``stem[-tags][.date][.version][.suffix]``, the last part is taken as suffix if it can be.
+    """
+    head, dot, rest = file_name.partition('.')
+    stem, dash, tags = head.partition('-')
+    if not _is_word(stem) or (dash and not _is_word(tags.replace('-', '_'))):
+        return None
+    tags = tags or None
+    if not dot:
+        return stem, tags, None, None, None
+
+    parts = rest.split('.')
+    date = parts[0]
+    if len(date) == 8 and date.isdecimal():
+        version_suffix = _scan_version_suffix(parts[1:])
+        if version_suffix is not None:
+            return stem, tags, date, *version_suffix
+    version_suffix = _scan_version_suffix(parts)
+    if version_suffix is not None:
+        return stem, tags, None, *version_suffix
+
+
+def __getattr__(name: str) -> Any:
+    # keep ``namefile.core.Version`` available, ``packaging.version`` is only imported when it is accessed
+    if name == 'Version':
+        from packaging.version import Version
+
+        return Version
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Version:
+    # imported on demand, names without version don't pay for importing ``packaging``
+    from packaging.version import LegacyVersion
+    from packaging.version import parse as version_parse
+
+    parsed_version = version_parse(version)
+    if isinstance(parsed_version, LegacyVersion):
+        raise ValueError('LegacyVersion is not supported')
+    return parsed_version
+
+
+@lru_cache(maxsize=1024)
+def _version_str(version: Version, release: tuple[int, ...]) -> str:
+    # ``Version('1.0') == Version('1.0.0')``, so ``release`` is part of the cache key to keep their strings apart
+    return str(version)
 
 
 def sanitize_stem(stem: str) -> str:
@@ -45,14 +127,35 @@ def sanitize_stem(stem: str) -> str:
             >>> sanitize_stem('foo-bar')
             'foo_bar'
     """
-    for char in INVALID_STEM_CHAR:
-        stem = stem.replace(char, '_')
+    stem = stem.translate(_STEM_TRANS)
     if not stem:
         raise ValueError('stem is empty')
     return stem
 
 
-@dataclass(repr=True)
+def _format_name(
+    stem: str,
+    suffix: None | str,
+    tags: list[str],
+    date: None | datetime.date,
+    version: None | Version,
+) -> str:
+    parts = [stem]
+    if tags:
+        parts.append('-')
+        parts.append('-'.join(tags))
+    if date is not None:
+        parts.append(f'.{date.year:04d}{date.month:02d}{date.day:02d}')
+    if version is not None:
+        parts.append('.')
+        parts.append(_version_str(version, version.release))
+    if suffix is not None:
+        parts.append('.')
+        parts.append(suffix)
+    return ''.join(parts)
+
+
+@dataclass(repr=True, **_DATACLASS_SLOTS)
 class FileInfo:
     """FileInfo ValueObj
 
@@ -97,8 +200,8 @@ class FileInfo:
     def _process_stem(stem: str) -> str:
         if not stem:
             raise ValueError('stem is empty')
-        stem = sanitize_stem(stem)
-        if not re.fullmatch(STEM_PATTERN, stem):
+        stem = stem.translate(_STEM_TRANS)
+        if not _is_word(stem):
             raise ValueError(f'bad stem: {stem}')
         return stem
 
@@ -106,7 +209,7 @@ class FileInfo:
     def _process_suffix(suffix: None | str) -> None | str:
         if suffix is None or not suffix:
             return
-        elif not re.fullmatch(VALID_SUFFIX_PATTERN, suffix):
+        elif not _is_suffix(suffix):
             raise ValueError(f'bad suffix: {suffix}')
         return suffix
 
@@ -117,22 +220,18 @@ class FileInfo:
 
         if isinstance(tags, str):
             tags = [tags]
-        tags = set([sanitize_stem(tag) for tag in tags])
-        for tag in tags:
-            if not re.fullmatch(VALID_TAG_PATTERN, tag):
+        unique_tags = {tag.translate(_STEM_TRANS) for tag in tags}
+        for tag in unique_tags:
+            if not _is_word(tag):
                 raise ValueError(f'bad tag: {tag}')
-        tags = sorted(list(tags))
-        return tags
+        return sorted(unique_tags)
 
     @staticmethod
     def _process_version(version: None | str | Version) -> None | Version:
         if version is None:
             return
         if isinstance(version, str):
-            parsed_version = version_parse(version)
-            if isinstance(parsed_version, LegacyVersion):
-                raise ValueError('LegacyVersion is not supported')
-            return parsed_version
+            return _parse_version(version)
         return version
 
     @staticmethod
@@ -155,6 +254,24 @@ class FileInfo:
         self.version = self._process_version(self.version)
         self.date = self._process_date(self.date)
 
+    @classmethod
+    def _from_parsed(
+        cls,
+        stem: str,
+        suffix: None | str,
+        tags: list[str],
+        date: None | datetime.date,
+        version: None | Version,
+    ) -> FileInfo:
+        # build from already validated fields, skip :meth:`__post_init__`
+        file_info = cls.__new__(cls)
+        file_info.stem = stem
+        file_info.suffix = suffix
+        file_info.tags = tags
+        file_info.date = date
+        file_info.version = version
+        return file_info
+
     def __str__(self) -> str:
         return self.name()
 
@@ -186,27 +303,7 @@ class FileInfo:
                 >>> fileinfo.name() == str(fileinfo)
                 True
         """
-        if self.suffix is None:
-            suffix = ''
-        else:
-            suffix = '.' + self.suffix
-
-        if self.tags:
-            tags = '-' + '-'.join(sorted(list(self.tags)))
-        else:
-            tags = ''
-
-        if self.version is None:
-            version = ''
-        else:
-            version = '.' + str(self.version)
-
-        if self.date is not None:
-            date = '.' + self.date.strftime(DATE_FORMAT)
-        else:
-            date = ''
-
-        return f'{self.stem}{tags}{date}{version}{suffix}'
+        return _format_name(self.stem, self.suffix, self.tags, self.date, self.version)
 
     @classmethod
     def parse(cls, file_name: str) -> FileInfo:
@@ -227,21 +324,25 @@ class FileInfo:
         Returns:
             :class:`FileInfo`: Parsed file info.
         """
-        match = re.match(FILE_NAME_PATTERN, file_name) or re.match(DIR_NAME_PATTERN, file_name)
-        if match is None:
+        scanned = _scan_name(file_name)
+        if scanned is None:
             raise ValueError(f'Invalid file name: {file_name}')
-        match_dict: dict[str, Any] = match.groupdict()
+        stem, tags, date, version, suffix = scanned
 
-        if (tag := match_dict['tags']) is not None:
-            match_dict['tags'] = tag.split('-')
+        if tags is not None:
+            tag_list = tags.split('-')
+            if '' in tag_list:
+                raise ValueError(f'Invalid file name: {file_name}')
+            tag_list = sorted(set(tag_list))
         else:
-            match_dict['tags'] = []
+            tag_list = []
 
-        if (date := match_dict['date']) is not None:
-            match_dict['date'] = datetime.datetime.strptime(date, DATE_FORMAT).date()
+        if date is not None:
+            parsed_date = datetime.date(int(date[:4]), int(date[4:6]), int(date[6:]))
+        else:
+            parsed_date = None
 
-        file_info = cls(**match_dict)
-        return file_info
+        return cls._from_parsed(stem, suffix, tag_list, parsed_date, cls._process_version(version))
 
     def is_file(self):
         return self.suffix is not None
@@ -268,9 +369,16 @@ def namefile(
             >>> str(fileinfo)
             'foo-bar-baz.20200101.1.0.0.txt'
     """
-
-    file_info = FileInfo(stem, suffix, tags, date, version)   # type: ignore
-    return file_info.name()
+    if suffix is None and tags is None and (date is None or date is False) and version is None:
+        return FileInfo._process_stem(stem)
+
+    return _format_name(
+        FileInfo._process_stem(stem),
+        FileInfo._process_suffix(suffix),
+        FileInfo._process_tags(tags),
+        FileInfo._process_date(date),
+        FileInfo._process_version(version),
+    )
 
 
 def nameparse(file_name: str) -> FileInfo:
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import datetime
+import os
+
+import pytest
+from hypothesis import HealthCheck, settings
+
+from namefile.core import namefile, nameparse
+
+settings.register_profile(
+    'fast', max_examples=50, deadline=None, database=None, suppress_health_check=[HealthCheck.too_slow]
+)
+settings.load_profile(os.environ.get('HYPOTHESIS_PROFILE', 'fast'))
+
+# ((stem, suffix, tags, date, version), expected file name), args in the same order as :func:`namefile`,
+# ``{today}`` in the expected file name stands for ``date=True``
+COMMON_CASES = [
+    (('Moka-1', 'csv', 'error', True, '1.0.1.post1'), 'Moka_1-error.{today}.1.0.1.post1.csv'),
+    (
+        ('Moka', 'csv', ['error', 'warning', 'error'], datetime.date(2022, 10, 1), '2.0'),
+        'Moka-error-warning.20221001.2.0.csv',
+    ),
+    (('foo bar', 'txt', None, False, None), 'foo_bar.txt'),
+    (('foo/bar', None, 'a-b', datetime.datetime(2020, 1, 1, 12), '1.0.0'), 'foo_bar-a_b.20200101.1.0.0'),
+    (('foo', 'tar_gz', None, None, '1.0'), 'foo.1.0.tar_gz'),
+    (('数据', 'xlsx', ['标签'], None, None), '数据-标签.xlsx'),
+]
+
+
+@pytest.fixture(scope='module', params=COMMON_CASES)
+def built(request):
+    args, expected = request.param
+    filename = namefile(*args)
+    return args, expected.format(today=datetime.date.today().strftime('%Y%m%d')), filename, nameparse(filename)
@@ -1,58 +1,66 @@
 from __future__ import annotations
 
 import datetime
+import subprocess
+import sys
 
-from hypothesis import given, note
-from hypothesis import strategies as st
+import pytest
 from packaging.version import parse as version_parse
 
-from namefile.core import (
-    STEM_PATTERN,
-    VALID_SUFFIX_PATTERN,
-    VALID_TAG_PATTERN,
-    FileInfo,
-    namefile,
-    nameparse,
-)
-
-tag_string_strategy = st.from_regex(VALID_TAG_PATTERN, fullmatch=True)
+from namefile.core import FileInfo, namefile, nameparse
 
 
-@given(
-    stem=st.from_regex(STEM_PATTERN, fullmatch=True),
-    suffix=st.one_of(st.none(), st.from_regex(VALID_SUFFIX_PATTERN, fullmatch=True)),
-    tags=st.one_of(st.none(), tag_string_strategy, st.lists(tag_string_strategy, min_size=1)),
-    date=st.one_of(
-        st.none(),
-        st.booleans(),
-        st.dates(min_value=datetime.date(2000, 1, 1)),
-        st.datetimes(min_value=datetime.datetime(2000, 1, 1)),
-    ),
-    version=st.one_of(st.none(), st.just('1.0.1.post1'), st.just('2.0')),
-)
-def test_file_name(stem, suffix, tags, date, version):
-    filename = namefile(stem, suffix, tags, date, version)
+def test_file_name_cases(built):
+    (stem, suffix, tags, date, version), expected, filename, fileinfo = built
+    assert filename == expected
     if suffix is not None:
-        assert filename.endswith(suffix)
-
-    fileinfo1 = nameparse(filename)
+        assert suffix == filename[-len(suffix):]
     if date is True:
-        date = fileinfo1.date
-    if date is False:
-        date = None
+        date = fileinfo.date
+
+    assert str(fileinfo) == filename
+    assert fileinfo == FileInfo(stem, suffix, tags, date, version)   # type: ignore
 
-    if not suffix:
-        assert fileinfo1.suffix is None
 
-    else:
-        assert fileinfo1.suffix == suffix
+def test_equal_versions_keep_their_own_name():
+    # ``Version('1.0') == Version('1.0.0')``, the cached version string must not be shared between them
+    assert namefile('foo', 'txt', version='1.0.0') == 'foo.1.0.0.txt'
+    assert namefile('foo', 'txt', version='1.0') == 'foo.1.0.txt'
+    assert str(nameparse('foo.1.0.0.txt')) == 'foo.1.0.0.txt'
 
-    if version is not None:
-        assert fileinfo1.version == version_parse(str(version))
 
-    fileinfo2 = FileInfo(stem, suffix, tags, date, version)   # type: ignore
-    note(f'{fileinfo1!r}')
-    note(f'{fileinfo2!r}')
+@pytest.mark.parametrize('file_name', ['foo bar', 'foo-.txt', 'foo.txt\n', 'a-b--c.txt', 'foo.20201301.txt'])
+def test_parse_invalid_file_name(file_name):
+    with pytest.raises(ValueError):
+        nameparse(file_name)
+
+
+@pytest.mark.parametrize(
+    'file_name, date, version, suffix',
+    [
+        ('foo.20200101.1.0', datetime.date(2020, 1, 1), '1.0', None),
+        ('foo.1.0.0', None, '1.0.0', None),
+        ('foo.1.0.txt', None, '1.0', 'txt'),
+        ('foo.20200101.txt', datetime.date(2020, 1, 1), None, 'txt'),
+    ],
+)
+def test_parse_precedence(file_name, date, version, suffix):
+    fileinfo = nameparse(file_name)
+    assert fileinfo.stem == 'foo'
+    assert fileinfo.date == date
+    assert fileinfo.version == (version and version_parse(version))
+    assert fileinfo.suffix == suffix
+    assert str(fileinfo) == file_name
+
 
-    assert str(fileinfo1) == filename
-    assert fileinfo1 == fileinfo2
+def test_packaging_imported_on_demand():
+    # run in a fresh interpreter, ``packaging`` is already imported by this test module
+    code = (
+        'import sys\n'
+        'from namefile import namefile\n'
+        "assert namefile('foo', 'txt') == 'foo.txt'\n"
+        "assert 'packaging' not in sys.modules\n"
+        'from namefile.core import Version\n'
+        "assert Version('1.0') == Version('1.0.0')\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import datetime
+import string
+
+from hypothesis import given, note
+from hypothesis import strategies as st
+from packaging.version import parse as version_parse
+
+from namefile.core import FileInfo, namefile, nameparse
+
+DATES = [datetime.date(2000, 1, 1) + datetime.timedelta(days=i * 365) for i in range(32)]
+DATETIMES = [datetime.datetime.combine(date, datetime.time(hour=i % 24)) for i, date in enumerate(DATES)]
+VERSIONS = {version: version_parse(version) for version in ('1.0.1.post1', '2.0')}
+
+# same language as ``STEM_PATTERN``, ``VALID_TAG_PATTERN`` and ``VALID_SUFFIX_PATTERN``,
+# ``\w`` is the unicode letter and number categories plus ``_``
+word_char_strategy = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_')
+word_string_strategy = st.text(word_char_strategy, min_size=1)
+suffix_string_strategy = st.builds(
+    lambda head, last: head + last, st.text(word_char_strategy), st.sampled_from(string.ascii_letters)
+)
+tag_string_strategy = word_string_strategy
+
+
+@given(
+    stem=word_string_strategy,
+    suffix=st.one_of(st.none(), suffix_string_strategy),
+    tags=st.one_of(st.none(), tag_string_strategy, st.lists(tag_string_strategy, min_size=1)),
+    date=st.one_of(
+        st.sampled_from([None, True, False]),
+        st.sampled_from(DATES),
+        st.sampled_from(DATETIMES),
+    ),
+    version=st.sampled_from([None, *VERSIONS]),
+)
+def test_file_name(stem, suffix, tags, date, version):
+    filename = namefile(stem, suffix, tags, date, version)
+    if suffix is not None:
+        assert filename.endswith(suffix)
+
+    fileinfo1 = nameparse(filename)
+    if date is True:
+        date = fileinfo1.date
+    fileinfo2 = FileInfo(stem, suffix, tags, date, version)   # type: ignore
+
+    if not suffix:
+        assert fileinfo1.suffix is None
+
+    else:
+        assert fileinfo1.suffix == suffix
+
+    if version is not None:
+        assert fileinfo1.version == VERSIONS[version]
+
+    note(f'{fileinfo1!r}')
+    note(f'{fileinfo2!r}')
+
+    assert str(fileinfo1) == filename
+    assert fileinfo1 == fileinfo2